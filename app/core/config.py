@@ -4,6 +4,7 @@ import os
 from functools import lru_cache
 from typing import Literal
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 Environment = Literal["development", "production", "staging", "test"]
@@ -37,8 +38,11 @@ class Settings(BaseSettings):
     rate_limit: str = "60/minute"
     allowed_hosts: list[str] = ["*"]
     cors_origins: list[str] = []
-    enable_docs: bool = True
-    output_path: str = "data/output.jsonl"
+    enable_docs: bool | None = None
+    output_dir: str = "data/outputs"
+    # Deprecated single-file store, replaced by the day-partitioned output_dir.
+    output_path: str | None = None
+    openai_api_key: str | None = None
 
     database_url: str | None = None
     db_user: str = "postgres"
@@ -46,6 +50,33 @@ class Settings(BaseSettings):
     db_host: str = "localhost"
     db_port: int = 5432
     db_name: str = "econcontent"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
+    db_pool_pre_ping: bool = True
+    db_tcp_keepalives_idle: int = 30
+    db_tcp_keepalives_interval: int = 10
+    db_tcp_keepalives_count: int = 3
+    db_command_timeout: float = 60.0
+    db_connect_timeout: float = 10.0
+
+    @model_validator(mode="after")
+    def _default_enable_docs(self) -> Settings:
+        # Interactive docs stay off in production unless explicitly enabled.
+        if self.enable_docs is None:
+            self.enable_docs = self.environment != "production"
+        return self
+
+    @model_validator(mode="after")
+    def _reject_output_path(self) -> Settings:
+        # Fail loudly rather than silently reading an empty output_dir.
+        if self.output_path is not None:
+            raise ValueError(
+                "ECONCONTENT_OUTPUT_PATH is no longer supported; set ECONCONTENT_OUTPUT_DIR "
+                "to the directory holding the daily <date>.jsonl partitions."
+            )
+        return self
 
     @property
     def async_database_uri(self) -> str:
@@ -57,6 +88,6 @@ class Settings(BaseSettings):
         )
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     return Settings()
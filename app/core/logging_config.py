@@ -3,16 +3,51 @@ from __future__ import annotations
 import logging
 from logging.config import dictConfig
 
+import orjson
+
 from app.core.config import Settings
 
 
-def configure_logging(settings: Settings) -> None:
-    log_format = (
-        "%(levelname)s %(asctime)s %(name)s %(message)s"
-        if not settings.log_json
-        else "%(message)s"
-    )
+class OrjsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects using orjson.
+
+    The constant keys and delimiters are serialized once; only the dynamic
+    values are encoded per record and spliced between them.
+    """
 
+    _PREFIX = b'{"level":'
+    _TIME = b',"time":'
+    _LOGGER = b',"logger":'
+    _MESSAGE = b',"message":'
+    _EXC_INFO = b',"exc_info":'
+    _STACK_INFO = b',"stack_info":'
+    _SUFFIX = b"}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            self._PREFIX,
+            orjson.dumps(record.levelname),
+            self._TIME,
+            orjson.dumps(record.created),
+            self._LOGGER,
+            orjson.dumps(record.name),
+            self._MESSAGE,
+            orjson.dumps(record.getMessage()),
+        ]
+        if record.exc_info and not record.exc_text:
+            # Cache the rendered traceback like logging.Formatter does.
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(self._EXC_INFO)
+            parts.append(orjson.dumps(record.exc_text))
+        if record.stack_info:
+            parts.append(self._STACK_INFO)
+            parts.append(orjson.dumps(self.formatStack(record.stack_info)))
+        parts.append(self._SUFFIX)
+        return b"".join(parts).decode()
+
+
+def configure_logging(settings: Settings) -> None:
     handlers: dict[str, dict[str, object]] = {
         "default": {
             "class": "logging.StreamHandler",
@@ -22,14 +57,12 @@ def configure_logging(settings: Settings) -> None:
 
     formatters: dict[str, dict[str, object]] = {
         "standard": {
-            "format": log_format,
+            "format": "%(levelname)s %(asctime)s %(name)s %(message)s",
         }
     }
 
     if settings.log_json:
-        formatters["standard"]["format"] = (
-            '{"level":"%(levelname)s","time":"%(asctime)s","logger":"%(name)s","message":"%(message)s"}'
-        )
+        formatters["standard"] = {"()": OrjsonFormatter}
 
     dictConfig(
         {
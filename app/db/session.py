@@ -1,14 +1,42 @@
+import asyncio
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
 
 settings = get_settings()
-engine = create_async_engine(settings.async_database_uri, pool_pre_ping=True)
+engine = create_async_engine(
+    settings.async_database_uri,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        "server_settings": {
+            "tcp_keepalives_idle": str(settings.db_tcp_keepalives_idle),
+            "tcp_keepalives_interval": str(settings.db_tcp_keepalives_interval),
+            "tcp_keepalives_count": str(settings.db_tcp_keepalives_count),
+        },
+        "command_timeout": settings.db_command_timeout,
+        "timeout": settings.db_connect_timeout,
+    },
+)
 AsyncSessionFactory = async_sessionmaker(engine, expire_on_commit=False)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionFactory() as session:
         yield session
+
+
+async def _open_connection() -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def warm_pool(size: int) -> None:
+    """Open ``size`` connections concurrently so the pool is populated before traffic."""
+    await asyncio.gather(*(_open_connection() for _ in range(size)))
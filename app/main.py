@@ -1,17 +1,55 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
-from starlette.responses import JSONResponse
 
 from app.core.config import get_settings
 from app.core.logging_config import configure_logging
+from app.db.session import warm_pool
 from routers import content, news, reports, sources
+from services.content_generator import ContentGeneratorService
+from services.content_planner import ContentPlannerService
+from services.rss_fetcher import RSSFetcherService
+
+logger = logging.getLogger(__name__)
+
+
+def _route_operation_id(route: APIRoute) -> str:
+    return route.name
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    try:
+        await asyncio.wait_for(
+            warm_pool(settings.db_pool_size),
+            timeout=settings.db_connect_timeout,
+        )
+    except Exception:  # noqa: BLE001 - an unreachable database must not block startup
+        logger.exception("Database pool warm-up failed")
+
+    async with httpx.AsyncClient(
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    ) as http_client:
+        app.state.http_client = http_client
+        app.state.rss_fetcher = RSSFetcherService(client=http_client)
+        yield
 
 
 def create_app() -> FastAPI:
@@ -25,6 +63,16 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         openapi_url=openapi_url,
+        default_response_class=ORJSONResponse,
+        generate_unique_id_function=_route_operation_id,
+        lifespan=lifespan,
+    )
+
+    app.state.content_planner = ContentPlannerService()
+    app.state.content_generator = (
+        ContentGeneratorService(api_key=settings.openai_api_key)
+        if settings.openai_api_key
+        else None
     )
 
     if settings.environment == "production":
@@ -48,8 +96,8 @@ def create_app() -> FastAPI:
     app.add_middleware(SlowAPIMiddleware)
 
     @app.exception_handler(RateLimitExceeded)
-    async def rate_limit_handler(_: Request, exc: RateLimitExceeded) -> JSONResponse:
-        return JSONResponse(status_code=429, content={"detail": str(exc)})
+    async def rate_limit_handler(_: Request, exc: RateLimitExceeded) -> ORJSONResponse:
+        return ORJSONResponse(status_code=429, content={"detail": str(exc)})
 
     @app.middleware("http")
     async def add_security_headers(request: Request, call_next):  # type: ignore[no-untyped-def]
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from schemas.news import ArticleResponse, FetchNewsRequest, FetchNewsResponse
-from services.rss_fetcher import RSSFetcherService
+from services.rss_fetcher import RSSFetchError, RSSFetcherService
 
 logger = logging.getLogger(__name__)
 
@@ -14,24 +13,26 @@ router = APIRouter(tags=["news"])
 
 
 @router.post("/fetch-news", response_model=FetchNewsResponse)
-async def fetch_news(payload: FetchNewsRequest) -> FetchNewsResponse:
-    service = RSSFetcherService()
-    tasks = [service.fetch_latest(str(url), limit=payload.limit) for url in payload.source_urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+async def fetch_news(request: Request, payload: FetchNewsRequest) -> FetchNewsResponse:
+    service: RSSFetcherService = request.app.state.rss_fetcher
+    results = await service.fetch_many(
+        [str(url) for url in payload.source_urls],
+        limit=payload.limit,
+    )
 
     articles: list[ArticleResponse] = []
-    for url, result in zip(payload.source_urls, results, strict=False):
-        if isinstance(result, Exception):
-            logger.warning("Failed to fetch RSS feed %s: %s", url, result)
+    for source_url, result in results.items():
+        if isinstance(result, RSSFetchError):
+            logger.warning("Failed to fetch RSS feed %s: %s", source_url, result)
             continue
-        for item in result:
-            articles.append(
-                ArticleResponse(
-                    url=item.url,
-                    title=item.title,
-                    published_at=item.published_at,
-                )
+        articles.extend(
+            ArticleResponse(
+                url=item.url,
+                title=item.title,
+                published_at=item.published_at,
             )
+            for item in result
+        )
 
     if not articles:
         raise HTTPException(status_code=502, detail="Unable to fetch news from sources.")
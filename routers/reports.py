@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import os
 from datetime import date
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query
 
+from app.core.config import get_settings
 from schemas.reports import DailyReportResponse, KPIResponse
 from services.reporting import ReportingError, ReportingService
 
@@ -25,13 +25,17 @@ async def get_daily_report() -> DailyReportResponse:
 @router.get("/kpis", response_model=KPIResponse)
 async def get_kpis(
     report_date: date | None = Query(default=None, alias="date"),
-    output_path: str | None = Query(default=None),
+    output_dir: str | None = Query(default=None),
+    output_path: str | None = Query(default=None, deprecated=True),
 ) -> KPIResponse:
+    if output_path is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="output_path is no longer supported; use output_dir.",
+        )
     target_date = report_date or date.today()
-    resolved_path = Path(
-        output_path or os.getenv("ECONCONTENT_OUTPUT_PATH", "data/output.jsonl")
-    )
-    service = ReportingService(resolved_path)
+    resolved_dir = Path(output_dir or get_settings().output_dir)
+    service = ReportingService(resolved_dir)
     try:
         kpis = service.get_daily_kpis(target_date)
     except ReportingError as exc:
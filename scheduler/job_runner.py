@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import json
 import logging
-import os
 import time
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
 from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
 
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from app.core.config import get_settings
 from services.content_generator import ContentGenerationError, ContentGeneratorService, ContentType
 from services.content_planner import ContentPlanSlot, ContentPlannerService, ContentPlanningError, NewsItem
+from services.reporting import output_partition_path
 from services.rss_fetcher import RSSFetchError, RSSFetcherService
 
 logger = logging.getLogger(__name__)
@@ -26,19 +29,54 @@ class ContentPlanConfig:
 class SchedulerConfig:
     feed_urls: list[str]
     plan: ContentPlanConfig
-    output_path: Path
+    output_dir: Path
 
 
 class OutputStore:
-    """Persist generated outputs to a JSONL file."""
+    """Persist generated outputs to day-partitioned JSONL files.
 
-    def __init__(self, output_path: Path) -> None:
-        self._output_path = output_path
-        self._output_path.parent.mkdir(parents=True, exist_ok=True)
+    Each record is stamped with the current UTC time and appended to the
+    partition for that day. The partition file is opened lazily and kept open
+    until :meth:`close` (or until the day rolls over), so a job run appends all
+    of its records through one buffered handle.
+    """
+
+    _BUFFER_SIZE = 64 * 1024
+    _DUMP_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def __init__(self, output_dir: Path) -> None:
+        self._output_dir = output_dir
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._handle: BinaryIO | None = None
+        self._handle_date: date | None = None
 
     def write(self, payload: dict[str, object]) -> None:
-        with self._output_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        timestamp = datetime.now(UTC)
+        if self._handle is None or self._handle_date != timestamp.date():
+            self.close()
+            partition = output_partition_path(self._output_dir, timestamp.date())
+            self._handle = partition.open("ab", buffering=self._BUFFER_SIZE)
+            self._handle_date = timestamp.date()
+        self._handle.write(
+            orjson.dumps({"timestamp": timestamp, **payload}, option=self._DUMP_OPTIONS)
+        )
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._handle_date = None
+
+    def __enter__(self) -> OutputStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
 
 class DailyJobRunner:
@@ -48,29 +86,38 @@ class DailyJobRunner:
         self._config = config
         self._rss_fetcher = RSSFetcherService()
         self._planner = ContentPlannerService()
-        self._store = OutputStore(config.output_path)
+        self._store = OutputStore(config.output_dir)
 
     async def run_daily(self) -> None:
+        try:
+            await self._run()
+        finally:
+            self._store.close()
+            await self._rss_fetcher.aclose()
+
+    async def _run(self) -> None:
         logger.info("Starting daily automation job")
         if not self._config.feed_urls:
             logger.warning("No feed URLs configured; skipping job")
             return
 
-        try:
-            news_items = []
-            for feed_url in self._config.feed_urls:
-                articles = await self._rss_fetcher.fetch_latest(feed_url)
-                for article in articles:
-                    news_items.append(
-                        NewsItem(
-                            news_id=article.url,
-                            headline=article.title,
-                            is_breaking=False,
-                            published_at=article.published_at,
-                        )
-                    )
-        except RSSFetchError as exc:
-            logger.exception("Failed to fetch RSS feeds: %s", exc)
+        results = await self._rss_fetcher.fetch_many(self._config.feed_urls)
+        news_items: list[NewsItem] = []
+        for feed_url, result in results.items():
+            if isinstance(result, RSSFetchError):
+                logger.warning("Failed to fetch RSS feed %s: %s", feed_url, result)
+                continue
+            news_items.extend(
+                NewsItem(
+                    news_id=article.url,
+                    headline=article.title,
+                    is_breaking=False,
+                    published_at=article.published_at,
+                )
+                for article in result
+            )
+        if not news_items:
+            logger.warning("No news items fetched from RSS feeds; skipping job")
             return
 
         try:
@@ -78,18 +125,17 @@ class DailyJobRunner:
                 plan_slots=self._config.plan.plan_slots,
                 news_items=news_items,
             )
-        except ContentPlanningError as exc:
-            logger.exception("Content planning failed: %s", exc)
+        except ContentPlanningError:
+            logger.exception("Content planning failed")
             return
 
-        api_key = os.getenv("ECONCONTENT_OPENAI_API_KEY")
+        api_key = get_settings().openai_api_key
         if not api_key:
             logger.warning("OpenAI API key missing; storing planned tasks only")
             for task in tasks:
                 self._store.write(
                     {
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "task": asdict(task),
+                        "task": task,
                         "status": "planned",
                     }
                 )
@@ -110,8 +156,7 @@ class DailyJobRunner:
                 processing_time_seconds = time.perf_counter() - started_at
                 self._store.write(
                     {
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "task": asdict(task),
+                        "task": task,
                         "status": "failed",
                         "error": str(exc),
                         "processing_time_seconds": processing_time_seconds,
@@ -122,10 +167,9 @@ class DailyJobRunner:
             processing_time_seconds = time.perf_counter() - started_at
             self._store.write(
                 {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "task": asdict(task),
+                    "task": task,
                     "status": "completed",
-                    "content": asdict(content),
+                    "content": content,
                     "processing_time_seconds": processing_time_seconds,
                 }
             )
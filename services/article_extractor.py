@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from dataclasses import dataclass
 
 import httpx
@@ -26,14 +25,18 @@ class ArticleContent:
 class ArticleExtractorService:
     """Extract clean text content from an article URL."""
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    def __init__(self, timeout: float = 10.0, client: httpx.AsyncClient | None = None) -> None:
         self._timeout = timeout
+        self._client = client
 
     async def extract(self, url: str) -> ArticleContent:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            if self._client is not None:
+                response = await self._client.get(url)
+            else:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.get(url)
+            response.raise_for_status()
         except httpx.HTTPError as exc:
             raise ArticleExtractionError(f"Failed to fetch article: {url}") from exc
 
@@ -50,7 +53,7 @@ class ArticleExtractorService:
         except (ValueError, TypeError, ParserError) as exc:
             raise ArticleExtractionError(f"Failed to extract content: {url}") from exc
 
-        clean_text = re.sub(r"\s+", " ", text).strip()
+        clean_text = " ".join(text.split())
         if not clean_text:
             raise ArticleExtractionError(f"Empty article content extracted: {url}")
 
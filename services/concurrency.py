@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    concurrency: int,
+) -> list[T | BaseException]:
+    """Await ``awaitables`` with at most ``concurrency`` of them running at once.
+
+    Results keep the input order. Like ``gather(..., return_exceptions=True)``,
+    a failure is returned as its exception instead of aborting the others.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(run(awaitable) for awaitable in awaitables),
+        return_exceptions=True,
+    )
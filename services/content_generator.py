@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from enum import Enum
 
 from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict
+
+from services.http import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,17 @@ class ContentType(str, Enum):
     table_number = "table-number"
 
 
+class TelegramContentModel(BaseModel):
+    """Structured-output schema the model must return for Telegram content."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    lead: str
+    body: str
+    analysis: str
+    cta: str
+
+
 class ContentGenerationError(RuntimeError):
     """Raised when content generation fails or returns invalid output."""
 
@@ -64,8 +77,9 @@ class ContentGeneratorService:
         model: str = "gpt-4o",
         max_output_tokens: int = 500,
         max_input_chars: int = 6000,
+        client: AsyncOpenAI | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = client if client is not None else get_openai_client(api_key)
         self._model = model
         self._max_output_tokens = max_output_tokens
         self._max_input_chars = max_input_chars
@@ -73,7 +87,8 @@ class ContentGeneratorService:
     def _truncate(self, text: str) -> str:
         if len(text) <= self._max_input_chars:
             return text
-        logger.debug("Truncating input from %s to %s chars", len(text), self._max_input_chars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Truncating input from %s to %s chars", len(text), self._max_input_chars)
         return text[: self._max_input_chars].rstrip()
 
     async def generate(
@@ -83,58 +98,49 @@ class ContentGeneratorService:
         key_facts: list[str],
         content_type: ContentType,
     ) -> TelegramContent:
-        if not headline.strip():
+        headline = headline.strip()
+        summary = summary.strip()
+        if not headline:
             raise ContentGenerationError("Headline is required.")
-        if not summary.strip():
+        if not summary:
             raise ContentGenerationError("Summary is required.")
         if not key_facts:
             raise ContentGenerationError("Key facts are required.")
 
-        facts_text = " | ".join(item.strip() for item in key_facts if item.strip())
+        facts_text = " | ".join(fact for fact in (item.strip() for item in key_facts) if fact)
         if not facts_text:
             raise ContentGenerationError("Key facts are required.")
 
         prompt = PROMPT_TEMPLATE.format(
-            headline=self._truncate(headline.strip()),
-            summary=self._truncate(summary.strip()),
+            headline=self._truncate(headline),
+            summary=self._truncate(summary),
             key_facts=self._truncate(facts_text),
             content_type=content_type.value,
         )
 
         try:
-            response = await self._client.responses.create(
+            response = await self._client.responses.parse(
                 model=self._model,
                 input=[
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
-                response_format={"type": "json_object"},
+                text_format=TelegramContentModel,
                 temperature=0.3,
                 max_output_tokens=self._max_output_tokens,
             )
         except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as generation failures
             raise ContentGenerationError("OpenAI request failed.") from exc
 
-        content = getattr(response, "output_text", None)
-        if not content:
+        parsed = getattr(response, "output_parsed", None)
+        if parsed is None:
             raise ContentGenerationError("OpenAI returned empty response.")
 
-        try:
-            payload = json.loads(content)
-        except json.JSONDecodeError as exc:
-            raise ContentGenerationError("OpenAI returned invalid JSON.") from exc
-
-        lead = payload.get("lead")
-        body = payload.get("body")
-        analysis = payload.get("analysis")
-        cta = payload.get("cta")
-
-        if not all(isinstance(item, str) and item.strip() for item in [lead, body, analysis, cta]):
+        lead = parsed.lead.strip()
+        body = parsed.body.strip()
+        analysis = parsed.analysis.strip()
+        cta = parsed.cta.strip()
+        if not (lead and body and analysis and cta):
             raise ContentGenerationError("OpenAI response missing required fields.")
 
-        return TelegramContent(
-            lead=lead.strip(),
-            body=body.strip(),
-            analysis=analysis.strip(),
-            cta=cta.strip(),
-        )
+        return TelegramContent(lead=lead, body=body, analysis=analysis, cta=cta)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Protocol
 
 logger = logging.getLogger(__name__)
 
@@ -36,39 +38,74 @@ class ContentTask:
     headline: str
 
 
+class PlanSlotLike(Protocol):
+    """Any object exposing the plan slot attributes the planner reads."""
+
+    @property
+    def slot_id(self) -> str: ...
+
+    @property
+    def post_type(self) -> str: ...
+
+
+class NewsItemLike(Protocol):
+    """Any object exposing the news item attributes the planner reads."""
+
+    @property
+    def news_id(self) -> str: ...
+
+    @property
+    def headline(self) -> str: ...
+
+    @property
+    def is_breaking(self) -> bool: ...
+
+    @property
+    def published_at(self) -> datetime | None: ...
+
+
 class ContentPlanningError(RuntimeError):
     """Raised when content planning fails due to invalid inputs."""
 
 
+def _news_priority(item: NewsItemLike) -> tuple[bool, float]:
+    """Sort key: breaking news first, then newest first, undated items last."""
+    if item.published_at is None:
+        return (not item.is_breaking, float("inf"))
+    return (not item.is_breaking, -item.published_at.timestamp())
+
+
 class ContentPlannerService:
     """Match plan slots with news items without duplicates and breaking-news priority."""
 
     def create_tasks(
         self,
-        plan_slots: list[ContentPlanSlot],
-        news_items: list[NewsItem],
+        plan_slots: Sequence[PlanSlotLike],
+        news_items: Sequence[NewsItemLike],
     ) -> list[ContentTask]:
+        """Assign the highest-priority unused news item to each slot.
+
+        Inputs are duck-typed, so both the dataclasses above and the API's
+        request models can be passed without conversion.
+        """
         if not plan_slots:
             raise ContentPlanningError("At least one plan slot is required.")
         if not news_items:
             raise ContentPlanningError("At least one news item is required.")
 
-        sorted_news = sorted(
-            news_items,
-            key=lambda item: (
-                not item.is_breaking,
-                -(item.published_at.timestamp()) if item.published_at else float("inf"),
-            ),
-        )
+        sorted_news = sorted(news_items, key=_news_priority)
 
         tasks: list[ContentTask] = []
         used_news_ids: set[str] = set()
+        # Each slot resumes from where the previous one stopped, so every news
+        # item is inspected at most once across all slots.
+        remaining_news = iter(sorted_news)
 
         for slot in plan_slots:
             matched = next(
                 (
                     item
-                    for item in sorted_news
+                    for item in remaining_news
                     if item.news_id not in used_news_ids
                 ),
                 None,
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
+import orjson
 from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict
+
+from services.concurrency import gather_bounded
+from services.http import get_openai_client
+from services.openai_retry import retry_openai_call, without_sdk_retries
+from services.result_cache import (
+    DEFAULT_TTL_SECONDS,
+    InMemoryResultCache,
+    ResultCache,
+    SemanticCache,
+    content_key,
+)
+from services.tokens import load_encoding, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +48,16 @@ Summary:
 """.strip()
 
 
+class HeadlineModel(BaseModel):
+    """Structured-output schema the model must return for headline variants."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    problem_headline: str
+    number_headline: str
+    question_headline: str
+
+
 class HeadlineGenerationError(RuntimeError):
     """Raised when headline generation fails or returns invalid output."""
 
@@ -47,65 +70,105 @@ class HeadlineVariants:
 
 
 class HeadlineGeneratorService:
-    """Generate Persian economic news headlines with OpenAI responses API."""
+    """Generate Persian economic news headlines with OpenAI responses API.
+
+    Results are cached by a hash of the summary text, so re-polled articles do
+    not trigger another model call.
+    """
 
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o",
         max_output_tokens: int = 200,
-        max_input_chars: int = 4000,
+        max_input_tokens: int = 1000,
+        cache: ResultCache | None = None,
+        cache_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        semantic_cache: SemanticCache | None = None,
+        client: AsyncOpenAI | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = without_sdk_retries(
+            client if client is not None else get_openai_client(api_key)
+        )
         self._model = model
         self._max_output_tokens = max_output_tokens
-        self._max_input_chars = max_input_chars
+        self._max_input_tokens = max_input_tokens
+        self._cache = cache if cache is not None else InMemoryResultCache()
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._semantic_cache = semantic_cache
+        self._cache_namespace = content_key(
+            f"headlines:{model}:{max_input_tokens}:{max_output_tokens}",
+            SYSTEM_PROMPT + PROMPT_TEMPLATE,
+        )
 
     def _truncate(self, text: str) -> str:
-        if len(text) <= self._max_input_chars:
-            return text
-        logger.debug("Truncating input from %s to %s chars", len(text), self._max_input_chars)
-        return text[: self._max_input_chars].rstrip()
+        return truncate_to_tokens(text, self._max_input_tokens, self._model)
+
+    async def generate_many(
+        self,
+        summaries: list[str],
+        concurrency: int = 20,
+    ) -> list[HeadlineVariants | BaseException]:
+        """Generate headlines for ``summaries`` via :func:`gather_bounded`.
+
+        Results are in input order, with failed items as their exception.
+        """
+        return await gather_bounded(
+            (self.generate(summary) for summary in summaries), concurrency
+        )
 
     async def generate(self, summarized_text: str) -> HeadlineVariants:
         cleaned = summarized_text.strip()
         if not cleaned:
             raise HeadlineGenerationError("No summary provided.")
 
+        cache_key = content_key(self._cache_namespace, cleaned)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return HeadlineVariants(**orjson.loads(cached))
+        if self._semantic_cache is not None:
+            similar = await self._semantic_cache.lookup(cleaned)
+            if similar is not None:
+                return HeadlineVariants(**similar)
+
+        variants = await self._request_variants(cleaned)
+        self._cache.set(cache_key, orjson.dumps(variants), expire=self._cache_ttl_seconds)
+        if self._semantic_cache is not None:
+            await self._semantic_cache.store(cleaned, asdict(variants))
+        return variants
+
+    async def _request_variants(self, cleaned: str) -> HeadlineVariants:
+        await load_encoding()
         prompt = PROMPT_TEMPLATE.format(summary=self._truncate(cleaned))
 
         try:
-            response = await self._client.responses.create(
-                model=self._model,
-                input=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-                max_output_tokens=self._max_output_tokens,
+            response = await retry_openai_call(
+                lambda: self._client.responses.parse(
+                    model=self._model,
+                    input=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    text_format=HeadlineModel,
+                    temperature=0.3,
+                    max_output_tokens=self._max_output_tokens,
+                )
             )
         except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as generation failures
             raise HeadlineGenerationError("OpenAI request failed.") from exc
 
-        content = getattr(response, "output_text", None)
-        if not content:
+        parsed = getattr(response, "output_parsed", None)
+        if parsed is None:
             raise HeadlineGenerationError("OpenAI returned empty response.")
 
-        try:
-            payload = json.loads(content)
-        except json.JSONDecodeError as exc:
-            raise HeadlineGenerationError("OpenAI returned invalid JSON.") from exc
-
-        problem = payload.get("problem_headline")
-        number = payload.get("number_headline")
-        question = payload.get("question_headline")
-
-        if not all(isinstance(item, str) and item.strip() for item in [problem, number, question]):
+        problem = parsed.problem_headline.strip()
+        number = parsed.number_headline.strip()
+        question = parsed.question_headline.strip()
+        if not (problem and number and question):
             raise HeadlineGenerationError("OpenAI response missing required fields.")
 
         return HeadlineVariants(
-            problem_headline=problem.strip(),
-            number_headline=number.strip(),
-            question_headline=question.strip(),
+            problem_headline=problem,
+            number_headline=number,
+            question_headline=question,
         )
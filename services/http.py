@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from openai import AsyncOpenAI
+
+
+# One client per API key; bounded so rotated keys cannot grow the cache without limit.
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return a process-wide AsyncOpenAI client so services share one connection pool."""
+    return AsyncOpenAI(api_key=api_key)
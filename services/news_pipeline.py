@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict
+
+from services.headline_generator import HeadlineVariants
+from services.http import get_openai_client
+from services.news_summarizer import NewsSummary, clean_news_text
+from services.openai_retry import retry_openai_call, without_sdk_retries
+from services.tokens import load_encoding, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = """You are a professional Persian economic news editor. Return only valid JSON."""
+
+PROMPT_TEMPLATE = """
+Summarize the Persian news text below and write headlines for it.
+
+Summary requirements:
+- Write a concise summary of 2-3 sentences.
+- Extract 3-6 key points as short phrases.
+- Extract 3-6 bullet key facts as complete short sentences.
+- Keep output brief and faithful to the source.
+
+Headline requirements:
+- 3 Persian headline variants based on the summary
+- Telegram-optimized
+- Max 90 characters each
+- No clickbait, no exaggeration
+- Keep accurate and neutral tone
+
+Headline types:
+1) Problem-oriented
+2) Number-driven
+3) Question-based
+
+Return JSON with exactly these keys:
+summary: string
+key_points: array of strings
+key_facts: array of strings
+problem_headline: string
+number_headline: string
+question_headline: string
+
+Text:
+{clean_text}
+""".strip()
+
+
+class ProcessedNewsModel(BaseModel):
+    """Structured-output schema the model must return for a summary with headlines."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    summary: str
+    key_points: list[str]
+    key_facts: list[str]
+    problem_headline: str
+    number_headline: str
+    question_headline: str
+
+
+class NewsPipelineError(RuntimeError):
+    """Raised when combined summarization and headline generation fails."""
+
+
+@dataclass(frozen=True)
+class ProcessedNews:
+    summary: NewsSummary
+    headlines: HeadlineVariants
+
+
+class NewsPipelineService:
+    """Summarize news and generate headlines in a single OpenAI request.
+
+    Equivalent to chaining ``NewsSummarizerService.summarize`` and
+    ``HeadlineGeneratorService.generate`` but saves one round trip and sends
+    the article text to the model only once.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        max_output_tokens: int = 600,
+        max_input_tokens: int = 2000,
+        client: AsyncOpenAI | None = None,
+    ) -> None:
+        self._client = without_sdk_retries(
+            client if client is not None else get_openai_client(api_key)
+        )
+        self._model = model
+        self._max_output_tokens = max_output_tokens
+        self._max_input_tokens = max_input_tokens
+
+    def _truncate(self, text: str) -> str:
+        return truncate_to_tokens(text, self._max_input_tokens, self._model)
+
+    async def summarize_and_headline(self, raw_text: str) -> ProcessedNews:
+        cleaned = clean_news_text(raw_text)
+        if not cleaned:
+            raise NewsPipelineError("No content to summarize.")
+
+        await load_encoding()
+        prompt = PROMPT_TEMPLATE.format(clean_text=self._truncate(cleaned))
+
+        try:
+            response = await retry_openai_call(
+                lambda: self._client.responses.parse(
+                    model=self._model,
+                    input=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    text_format=ProcessedNewsModel,
+                    temperature=0.2,
+                    max_output_tokens=self._max_output_tokens,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as pipeline failures
+            raise NewsPipelineError("OpenAI request failed.") from exc
+
+        parsed = getattr(response, "output_parsed", None)
+        if parsed is None:
+            raise NewsPipelineError("OpenAI returned empty response.")
+
+        summary = parsed.summary.strip()
+        problem = parsed.problem_headline.strip()
+        number = parsed.number_headline.strip()
+        question = parsed.question_headline.strip()
+        if not (summary and problem and number and question):
+            raise NewsPipelineError("OpenAI response missing required fields.")
+
+        return ProcessedNews(
+            summary=NewsSummary(
+                cleaned_text=cleaned,
+                summary=summary,
+                key_points=[item.strip() for item in parsed.key_points if item.strip()],
+                key_facts=[item.strip() for item in parsed.key_facts if item.strip()],
+            ),
+            headlines=HeadlineVariants(
+                problem_headline=problem,
+                number_headline=number,
+                question_headline=question,
+            ),
+        )
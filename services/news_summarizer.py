@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Any
 
+import orjson
 from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from services.concurrency import gather_bounded
+from services.http import get_openai_client
+from services.openai_retry import retry_openai_call, without_sdk_retries
+from services.result_cache import (
+    DEFAULT_TTL_SECONDS,
+    InMemoryResultCache,
+    ResultCache,
+    SemanticCache,
+    content_key,
+)
+from services.tokens import load_encoding, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +45,41 @@ Text:
 """.strip()
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_NEWLINES_RE = re.compile(r"\n{2,}")
+_WHITESPACE_RE = re.compile(r"\s{2,}")
+# Zero-width non-joiner and control whitespace all become plain spaces.
+_SPACE_TRANSLATION = str.maketrans(dict.fromkeys("\u200c\t\r\f\v", " "))
+
+
+class SummaryModel(BaseModel):
+    """Structured-output schema the model must return for a summary."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    summary: str
+    key_points: list[str]
+    key_facts: list[str]
+
+
+# Raw ``text`` option for requests that cannot use ``responses.parse`` (batch files).
+_SUMMARY_TEXT_OPTION = {
+    "format": {
+        "type": "json_schema",
+        "name": "news_summary",
+        "schema": SummaryModel.model_json_schema(),
+        "strict": True,
+    }
+}
+
+
+def clean_news_text(raw_text: str) -> str:
+    """Strip HTML tags and normalize whitespace in raw Persian news text."""
+    text = _TAG_RE.sub(" ", raw_text.translate(_SPACE_TRANSLATION))
+    text = _NEWLINES_RE.sub("\n", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
 class SummarizationError(RuntimeError):
     """Raised when summarization fails or returns invalid output."""
 
@@ -44,74 +93,131 @@ class NewsSummary:
 
 
 class NewsSummarizerService:
-    """Summarize Persian news text with OpenAI responses API."""
+    """Summarize Persian news text with OpenAI responses API.
+
+    Results are cached by a hash of the cleaned text, so re-polled articles do
+    not trigger another model call.
+    """
 
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o",
         max_output_tokens: int = 400,
-        max_input_chars: int = 8000,
+        max_input_tokens: int = 2000,
+        cache: ResultCache | None = None,
+        cache_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        semantic_cache: SemanticCache | None = None,
+        client: AsyncOpenAI | None = None,
     ) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = without_sdk_retries(
+            client if client is not None else get_openai_client(api_key)
+        )
         self._model = model
         self._max_output_tokens = max_output_tokens
-        self._max_input_chars = max_input_chars
+        self._max_input_tokens = max_input_tokens
+        self._cache = cache if cache is not None else InMemoryResultCache()
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._semantic_cache = semantic_cache
+        # The cache may be shared, so key on everything that shapes the output:
+        # model, token budgets and a fingerprint of the prompts.
+        self._cache_namespace = content_key(
+            f"summary:{model}:{max_input_tokens}:{max_output_tokens}",
+            SYSTEM_PROMPT + PROMPT_TEMPLATE,
+        )
 
     def clean_text(self, raw_text: str) -> str:
-        text = re.sub(r"<[^>]+>", " ", raw_text)
-        text = text.replace("\u200c", " ")
-        text = re.sub(r"[\t\r\f\v]+", " ", text)
-        text = re.sub(r"\n{2,}", "\n", text)
-        text = re.sub(r"\s{2,}", " ", text)
-        return text.strip()
+        return clean_news_text(raw_text)
 
     def _truncate(self, text: str) -> str:
-        if len(text) <= self._max_input_chars:
-            return text
-        logger.debug("Truncating input from %s to %s chars", len(text), self._max_input_chars)
-        return text[: self._max_input_chars].rstrip()
+        return truncate_to_tokens(text, self._max_input_tokens, self._model)
+
+    async def summarize_many(
+        self,
+        raw_texts: list[str],
+        concurrency: int = 20,
+    ) -> list[NewsSummary | BaseException]:
+        """Summarize many texts, keeping at most ``concurrency`` requests in flight.
+
+        Tune ``concurrency`` to the account's requests-per-minute limit. Failed
+        items come back as their exception, in input order.
+        """
+        return await gather_bounded(
+            (self.summarize(raw_text) for raw_text in raw_texts), concurrency
+        )
+
+    def _request_options(self, cleaned: str) -> dict[str, Any]:
+        prompt = PROMPT_TEMPLATE.format(clean_text=self._truncate(cleaned))
+        return {
+            "model": self._model,
+            "input": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.2,
+            "max_output_tokens": self._max_output_tokens,
+        }
+
+    def build_request_body(self, cleaned: str) -> dict[str, Any]:
+        """Build the raw responses API payload used for batch summarization."""
+        return {**self._request_options(cleaned), "text": _SUMMARY_TEXT_OPTION}
+
+    @staticmethod
+    def _to_summary(cleaned: str, parsed: SummaryModel) -> NewsSummary:
+        summary = parsed.summary.strip()
+        if not summary:
+            raise SummarizationError("OpenAI response missing required fields.")
+
+        return NewsSummary(
+            cleaned_text=cleaned,
+            summary=summary,
+            key_points=[item.strip() for item in parsed.key_points if item.strip()],
+            key_facts=[item.strip() for item in parsed.key_facts if item.strip()],
+        )
+
+    @classmethod
+    def parse_output(cls, cleaned: str, content: str | None) -> NewsSummary:
+        """Validate raw JSON output, e.g. from a batch result, into a :class:`NewsSummary`."""
+        if not content:
+            raise SummarizationError("OpenAI returned empty response.")
+
+        try:
+            parsed = SummaryModel.model_validate_json(content)
+        except ValidationError as exc:
+            raise SummarizationError("OpenAI returned invalid JSON.") from exc
+
+        return cls._to_summary(cleaned, parsed)
 
     async def summarize(self, raw_text: str) -> NewsSummary:
         cleaned = self.clean_text(raw_text)
         if not cleaned:
             raise SummarizationError("No content to summarize.")
 
-        prompt = PROMPT_TEMPLATE.format(clean_text=self._truncate(cleaned))
+        cache_key = content_key(self._cache_namespace, cleaned)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return NewsSummary(**orjson.loads(cached))
+        if self._semantic_cache is not None:
+            similar = await self._semantic_cache.lookup(cleaned)
+            if similar is not None:
+                return NewsSummary(**similar)
+
+        await load_encoding()
+        options = self._request_options(cleaned)
 
         try:
-            response = await self._client.responses.create(
-                model=self._model,
-                input=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.2,
-                max_output_tokens=self._max_output_tokens,
+            response = await retry_openai_call(
+                lambda: self._client.responses.parse(text_format=SummaryModel, **options)
             )
         except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as summarization failures
             raise SummarizationError("OpenAI request failed.") from exc
 
-        content = getattr(response, "output_text", None)
-        if not content:
+        parsed = getattr(response, "output_parsed", None)
+        if parsed is None:
             raise SummarizationError("OpenAI returned empty response.")
 
-        try:
-            payload = json.loads(content)
-        except json.JSONDecodeError as exc:
-            raise SummarizationError("OpenAI returned invalid JSON.") from exc
-
-        summary = payload.get("summary")
-        key_points = payload.get("key_points")
-        key_facts = payload.get("key_facts")
-
-        if not summary or not isinstance(key_points, list) or not isinstance(key_facts, list):
-            raise SummarizationError("OpenAI response missing required fields.")
-
-        return NewsSummary(
-            cleaned_text=cleaned,
-            summary=summary.strip(),
-            key_points=[str(item).strip() for item in key_points if str(item).strip()],
-            key_facts=[str(item).strip() for item in key_facts if str(item).strip()],
-        )
+        summary = self._to_summary(cleaned, parsed)
+        self._cache.set(cache_key, orjson.dumps(summary), expire=self._cache_ttl_seconds)
+        if self._semantic_cache is not None:
+            await self._semantic_cache.store(cleaned, asdict(summary))
+        return summary
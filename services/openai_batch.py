@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import orjson
+from openai import AsyncOpenAI
+
+from services.http import get_openai_client
+from services.news_summarizer import (
+    NewsSummarizerService,
+    NewsSummary,
+    SummarizationError,
+)
+from services.tokens import load_encoding
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/responses"
+_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
+
+
+class BatchJobError(RuntimeError):
+    """Raised when an OpenAI batch job cannot be submitted or completed."""
+
+
+def _output_text(body: dict[str, Any]) -> str | None:
+    """Concatenate the ``output_text`` parts of a raw responses API payload."""
+    text = "".join(
+        part.get("text", "")
+        for item in body.get("output") or []
+        if item.get("type") == "message"
+        for part in item.get("content") or []
+        if part.get("type") == "output_text"
+    )
+    return text or None
+
+
+class SummarizationBatchService:
+    """Summarize many texts offline through the OpenAI Batch API.
+
+    Batches complete within 24 hours at roughly half the per-token price of
+    online requests, so this suits nightly runs and backfills rather than
+    interactive use.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        poll_interval_seconds: float = 60.0,
+        client: AsyncOpenAI | None = None,
+    ) -> None:
+        self._client = client if client is not None else get_openai_client(api_key)
+        self._summarizer = NewsSummarizerService(api_key=api_key, client=self._client)
+        self._poll_interval_seconds = poll_interval_seconds
+
+    async def submit_summarization_batch(self, records: Mapping[str, str]) -> str:
+        """Upload ``records`` (custom id -> raw text) as one batch and return its id."""
+        await load_encoding()
+        lines: list[bytes] = []
+        for custom_id, raw_text in records.items():
+            cleaned = self._summarizer.clean_text(raw_text)
+            if not cleaned:
+                logger.warning("Skipping empty batch record %s", custom_id)
+                continue
+            lines.append(
+                orjson.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": self._summarizer.build_request_body(cleaned),
+                    }
+                )
+            )
+        if not lines:
+            raise BatchJobError("No content to summarize.")
+
+        try:
+            batch_file = await self._client.files.create(
+                file=("summaries.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = await self._client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+        except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as batch failures
+            raise BatchJobError("OpenAI batch submission failed.") from exc
+
+        return batch.id
+
+    async def poll_and_collect(
+        self,
+        batch_id: str,
+        records: Mapping[str, str],
+    ) -> dict[str, NewsSummary | SummarizationError]:
+        """Wait for ``batch_id`` to finish and parse its results by custom id.
+
+        ``records`` must be the mapping passed to :meth:`submit_summarization_batch`;
+        it is used to rebuild each summary's cleaned text. Every record id maps
+        to a result: requests that failed inside the batch land in its error
+        file rather than its output, so ids without an output line map to a
+        :class:`SummarizationError`.
+        """
+        try:
+            batch = await self._client.batches.retrieve(batch_id)
+            while batch.status in _PENDING_STATUSES:
+                await asyncio.sleep(self._poll_interval_seconds)
+                batch = await self._client.batches.retrieve(batch_id)
+
+            if batch.status != "completed":
+                raise BatchJobError(f"Batch {batch_id} ended with status {batch.status}.")
+
+            # A batch whose requests all failed completes with only an error file.
+            content = b""
+            if batch.output_file_id:
+                content = (await self._client.files.content(batch.output_file_id)).content
+        except BatchJobError:
+            raise
+        except Exception as exc:  # noqa: BLE001 - surface OpenAI errors as batch failures
+            raise BatchJobError(f"Failed to collect batch {batch_id}.") from exc
+
+        results: dict[str, NewsSummary | SummarizationError] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                raise BatchJobError(f"Batch {batch_id} returned invalid JSON.") from exc
+            if not isinstance(record, dict):
+                raise BatchJobError(f"Batch {batch_id} returned an invalid result line.")
+
+            custom_id = record.get("custom_id")
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                results[custom_id] = SummarizationError("OpenAI request failed.")
+                continue
+
+            cleaned = self._summarizer.clean_text(records.get(custom_id, ""))
+            try:
+                results[custom_id] = self._summarizer.parse_output(
+                    cleaned, _output_text(response.get("body") or {})
+                )
+            except SummarizationError as exc:
+                results[custom_id] = exc
+
+        for custom_id, raw_text in records.items():
+            if custom_id in results:
+                continue
+            if not self._summarizer.clean_text(raw_text):
+                # Skipped at submission time.
+                results[custom_id] = SummarizationError("No content to summarize.")
+            else:
+                results[custom_id] = SummarizationError("OpenAI request failed.")
+
+        return results
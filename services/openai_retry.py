@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+
+
+def without_sdk_retries(client: AsyncOpenAI) -> AsyncOpenAI:
+    """Return a copy of ``client`` for use under :func:`retry_openai_call`.
+
+    The copy shares the client's connection pool but disables the SDK's own
+    retries, which would otherwise multiply the attempts per call.
+    """
+    return client.with_options(max_retries=0)
+
+
+async def retry_openai_call(
+    call: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    base_delay: float = 1.0,
+) -> T:
+    """Await ``call``, retrying rate limits, 5xx and connection errors with jittered backoff.
+
+    The client used by ``call`` should come from :func:`without_sdk_retries`.
+    """
+    for attempt in range(attempts - 1):
+        try:
+            return await call()
+        except RETRYABLE_ERRORS as exc:
+            delay = base_delay * 2**attempt + random.uniform(0, base_delay)
+            logger.warning(
+                "OpenAI request failed with %s; retrying in %.2fs", type(exc).__name__, delay
+            )
+            await asyncio.sleep(delay)
+    return await call()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class ResultCache(Protocol):
+    """Key/value store for serialized LLM results.
+
+    ``diskcache.Cache`` satisfies this interface, as does a thin Redis wrapper.
+    """
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, expire: float | None = None) -> Any: ...
+
+
+class SemanticCache(Protocol):
+    """Extension point for similarity-based lookups, e.g. over text embeddings.
+
+    Consulted only after an exact content-hash miss.
+    """
+
+    async def lookup(self, text: str) -> dict[str, Any] | None: ...
+
+    async def store(self, text: str, value: dict[str, Any]) -> None: ...
+
+
+def content_key(namespace: str, text: str) -> str:
+    """Return a compact cache key for ``text`` within ``namespace``."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class InMemoryResultCache:
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, expire: float | None = None) -> None:
+        expires_at = time.monotonic() + expire if expire is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from io import BytesIO
+from types import TracebackType
 from typing import Any
+from xml.etree import ElementTree
 
-import feedparser
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -17,15 +20,103 @@ class RSSFetchError(RuntimeError):
 
 
 def _parse_published(entry: dict[str, Any]) -> datetime | None:
+    # feedparser already normalizes dates to UTC struct_time; only fall back to
+    # parsing the raw string when it could not.
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed is not None:
+        return datetime(*parsed[:6], tzinfo=UTC)
+
     published = entry.get("published") or entry.get("updated")
     if not published:
         return None
     try:
-        return parsedate_to_datetime(published)
+        value = parsedate_to_datetime(published)
     except (TypeError, ValueError):
-        logger.debug("Unable to parse published date: %s", published)
+        # Atom feeds use ISO 8601 rather than RFC 822 dates.
+        try:
+            value = datetime.fromisoformat(published)
+        except ValueError:
+            logger.debug("Unable to parse published date: %s", published)
+            return None
+    # Offset-less dates are taken as UTC, matching the struct_time path.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _parse_fast(body: bytes) -> list[dict[str, Any]] | None:
+    """Extract entries from a well-formed RSS 2.0 or Atom feed with ElementTree.
+
+    Returns ``None`` when the document is malformed or in another format, so
+    the caller can fall back to feedparser.
+    """
+    root_name: str | None = None
+    entries: list[dict[str, Any]] = []
+    try:
+        for event, element in ElementTree.iterparse(BytesIO(body), events=("start", "end")):
+            if root_name is None:
+                root_name = _local_name(element.tag)
+            if event != "end" or _local_name(element.tag) not in {"item", "entry"}:
+                continue
+
+            entry: dict[str, Any] = {}
+            for child in element:
+                name = _local_name(child.tag)
+                if name == "title":
+                    entry["title"] = "".join(child.itertext()).strip()
+                elif name == "link":
+                    href = child.get("href")
+                    if href is None:
+                        entry.setdefault("link", (child.text or "").strip())
+                    elif child.get("rel", "alternate") == "alternate":
+                        entry.setdefault("link", href.strip())
+                elif name == "guid" and child.get("isPermaLink", "true") != "false":
+                    # RSS guids are permalinks unless marked otherwise.
+                    permalink = (child.text or "").strip()
+                    if permalink:
+                        entry.setdefault("guid_link", permalink)
+                elif name in {"pubDate", "published", "date"}:
+                    entry["published"] = (child.text or "").strip()
+                elif name == "updated":
+                    entry["updated"] = (child.text or "").strip()
+            guid_link = entry.pop("guid_link", None)
+            if not entry.get("link") and guid_link:
+                entry["link"] = guid_link
+            entries.append(entry)
+            element.clear()
+    except ElementTree.ParseError:
         return None
 
+    if root_name not in {"rss", "feed"}:
+        return None
+    return entries
+
+
+def _parse_with_feedparser(body: bytes, feed_url: str) -> list[dict[str, Any]]:
+    # Imported lazily: feedparser is slow to import and only needed for feeds
+    # the ElementTree fast path cannot handle.
+    import feedparser
+
+    feed = feedparser.parse(body)
+    if feed.bozo:
+        raise RSSFetchError(f"Invalid RSS feed: {feed_url}")
+    return feed.entries
+
+
+def _parse_entries(body: bytes, feed_url: str) -> list[dict[str, Any]]:
+    """Parse feed entries, trying the ElementTree fast path before feedparser.
+
+    Blocking; run it in a worker thread so parsing never stalls the event loop.
+    """
+    entries = _parse_fast(body)
+    if entries is None:
+        entries = _parse_with_feedparser(body, feed_url)
+    return entries
+
 
 @dataclass(frozen=True)
 class RSSArticle:
@@ -35,25 +126,84 @@ class RSSArticle:
 
 
 class RSSFetcherService:
-    """Fetch RSS feed entries and return normalized article metadata."""
+    """Fetch RSS feed entries and return normalized article metadata.
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    Without an injected client the service lazily creates its own pooled
+    HTTP/2 client and reuses it across fetches until :meth:`aclose`.
+    """
+
+    def __init__(self, timeout: float = 10.0, client: httpx.AsyncClient | None = None) -> None:
         self._timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> RSSFetcherService:
+        self._get_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def fetch_many(
+        self,
+        feed_urls: list[str],
+        limit: int = 20,
+        concurrency: int = 16,
+    ) -> dict[str, list[RSSArticle] | RSSFetchError]:
+        """Fetch several feeds concurrently over the shared client.
+
+        At most ``concurrency`` requests are in flight at once. Duplicate URLs
+        are fetched once. A feed that fails for any reason maps to an
+        :class:`RSSFetchError` instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(feed_url: str) -> list[RSSArticle] | RSSFetchError:
+            async with semaphore:
+                try:
+                    return await self.fetch_latest(feed_url, limit=limit)
+                except RSSFetchError as exc:
+                    return exc
+                except Exception as exc:  # noqa: BLE001 - one broken feed must not fail the batch
+                    logger.exception("Unexpected error fetching RSS feed %s", feed_url)
+                    error = RSSFetchError(f"Failed to fetch RSS feed: {feed_url}")
+                    error.__cause__ = exc
+                    return error
+
+        unique_urls = list(dict.fromkeys(feed_urls))
+        results = await asyncio.gather(*(fetch_one(feed_url) for feed_url in unique_urls))
+        return dict(zip(unique_urls, results, strict=True))
 
     async def fetch_latest(self, feed_url: str, limit: int = 20) -> list[RSSArticle]:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(feed_url)
-                response.raise_for_status()
+            response = await self._get_client().get(feed_url)
+            response.raise_for_status()
         except httpx.HTTPError as exc:
             raise RSSFetchError(f"Failed to fetch RSS feed: {feed_url}") from exc
 
-        feed = feedparser.parse(response.text)
-        if feed.bozo:
-            raise RSSFetchError(f"Invalid RSS feed: {feed_url}")
+        entries = await asyncio.to_thread(_parse_entries, response.content, feed_url)
 
         articles: list[RSSArticle] = []
-        for entry in feed.entries[:limit]:
+        for entry in entries[:limit]:
             url = entry.get("link")
             title = entry.get("title")
             if not url or not title:
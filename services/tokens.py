@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_ENCODING = "o200k_base"
+
+# Encoding name -> loaded encoding, or None when loading failed. Filled by
+# load_encoding() so an unavailable tokenizer is only attempted once.
+_ENCODINGS: dict[str, tiktoken.Encoding | None] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+def _load_encoding(name: str) -> None:
+    with _LOAD_LOCK:
+        if name in _ENCODINGS:
+            return
+        try:
+            _ENCODINGS[name] = tiktoken.get_encoding(name)
+        except Exception as exc:  # noqa: BLE001 - an unavailable tokenizer degrades to character truncation
+            logger.warning(
+                "Could not load tiktoken encoding %s (%s); truncating inputs by characters",
+                name,
+                exc,
+            )
+            _ENCODINGS[name] = None
+
+
+async def load_encoding(name: str = _DEFAULT_ENCODING) -> None:
+    """Load the tokenizer used by :func:`truncate_to_tokens` on first call.
+
+    tiktoken downloads a missing BPE file synchronously and without a timeout,
+    so loading runs in a worker thread. Point ``TIKTOKEN_CACHE_DIR`` at a
+    pre-populated directory (the Docker image does) to avoid the download.
+    """
+    if name not in _ENCODINGS:
+        await asyncio.to_thread(_load_encoding, name)
+
+
+def _encoding_for(model: str) -> tiktoken.Encoding | None:
+    try:
+        name = tiktoken.encoding_name_for_model(model)
+    except KeyError:
+        name = _DEFAULT_ENCODING
+    # Encodings that were not loaded are approximated by the default one
+    # rather than downloaded on demand.
+    return _ENCODINGS.get(name) or _ENCODINGS.get(_DEFAULT_ENCODING)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens of ``model``'s tokenizer.
+
+    Falls back to character truncation until :func:`load_encoding` succeeded.
+    """
+    # Every token spans at least one UTF-8 byte (at most four per character),
+    # so texts this short always fit without encoding them.
+    if len(text) * 4 <= max_tokens:
+        return text
+
+    encoding = _encoding_for(model)
+    if encoding is None:
+        # One character per token is conservative for Persian text, where
+        # characters rarely merge into fewer tokens than that.
+        return text[:max_tokens].rstrip()
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Truncating input from %s to %s tokens", len(tokens), max_tokens)
+    # Decode bytes leniently: the cut may fall inside a multi-byte character.
+    return encoding.decode_bytes(tokens[:max_tokens]).decode("utf-8", "ignore").rstrip()